@@ -4,21 +4,50 @@ Generate sample FX Orders data in Parquet format.
 Creates realistic-looking data matching the unified-orders structure.
 
 Usage:
-    pip install pandas pyarrow
+    pip install numpy pyarrow
+    pip install numba  # optional, JIT-compiles the amount sampler
     python generate_sample_data.py
 
 Output:
     orders.parquet - 50K rows of sample FX order data
+    orders.arrow   - the same rows as an LZ4-compressed Arrow IPC file
 """
 
-import random
+import os
 import string
-from datetime import datetime, timedelta
-import pandas as pd
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; amounts fall back to plain NumPy
+    njit = None
 
 # Configuration
 NUM_ROWS = 50_000
 OUTPUT_FILE = "orders.parquet"
+ARROW_OUTPUT_FILE = "orders.arrow"  # Arrow IPC copy for fast local reads
+ARROW_COMPRESSION = "lz4_frame"
+ROW_GROUP_SIZE = 10_000  # Rows generated and written per batch
+COMPRESSION = "zstd"
+COMPRESSION_LEVEL = 1
+# Non-default Parquet encodings (these columns skip dictionary encoding)
+COLUMN_ENCODING = {
+    "buy_amount_cents": "DELTA_BINARY_PACKED",
+    "sell_amount_cents": "DELTA_BINARY_PACKED",
+    "rate": "BYTE_STREAM_SPLIT",
+}
+# Row order within each row group. Row groups cover consecutive creation_date
+# ranges; neighbours only share a boundary day once there are more row groups
+# than HISTORY_DAYS.
+SORT_ORDER = [("creation_date", "ascending"), ("buy_currency", "ascending")]
+SEED = 42  # Same seed on the same day gives the same file
 
 # Realistic FX data parameters
 CURRENCIES = ["EUR", "USD", "CHF", "GBP", "DKK", "SEK", "NOK", "JPY"]
@@ -36,6 +65,10 @@ EXCHANGE_RATES = {
     "JPY": 162.0,
 }
 
+# Cross rates: RATE_MATRIX[i, j] converts CURRENCIES[i] into CURRENCIES[j]
+_RATES_VS_EUR = np.array([EXCHANGE_RATES[c] for c in CURRENCIES], dtype=np.float64)
+RATE_MATRIX = _RATES_VS_EUR[np.newaxis, :] / _RATES_VS_EUR[:, np.newaxis]
+
 FX_ORDER_TYPES = ["forward", "chain", "spot"]
 FX_ORDER_TYPE_WEIGHTS = [0.3, 0.6, 0.1]  # chains are most common
 
@@ -43,178 +76,410 @@ MARKET_DIRECTIONS = ["buy", "sell"]
 
 STATUSES = ["open", "closed_to_trading", "completed"]
 STATUS_WEIGHTS = [0.5, 0.3, 0.2]
+HISTORY_DAYS = 366  # Creation dates fall within the last 12 months
 
-LIQUIDITY_PROVIDERS = ["SIVB", "RBS", "SEB", "BARC", "CITI", "HSBC"]
-
-
-def generate_reference(order_type: str) -> str:
-    """Generate a realistic order reference."""
-    suffix = "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
-    if order_type == "chain":
-        return f"KCH-{suffix}"
-    else:
-        return f"K-{suffix}"
+EXECUTED_STATUS_IDX = [STATUSES.index("closed_to_trading"), STATUSES.index("completed")]
 
+LIQUIDITY_PROVIDERS = ["SIVB", "RBS", "SEB", "BARC", "CITI", "HSBC"]
 
-def generate_rate(buy_currency: str, sell_currency: str) -> float:
-    """Generate a realistic exchange rate with some variation."""
-    if buy_currency == sell_currency:
-        return 1.0
+# Order size classes: small (100 - 50K), medium (50K - 500K),
+# large (500K - 5M) and very large (5M - 100M)
+AMOUNT_SIZE_WEIGHTS = [0.3, 0.4, 0.2, 0.1]
+AMOUNT_SIZE_LOW = np.array([100_00, 50_000_00, 500_000_00, 5_000_000_00], dtype=np.int64)
+AMOUNT_SIZE_HIGH = np.array(
+    [50_000_00, 500_000_00, 5_000_000_00, 100_000_000_00], dtype=np.int64
+)
+
+# Position of each currency in alphabetical order, for sorting by code
+CURRENCY_SORT_RANK = np.argsort(np.argsort(CURRENCIES))
+
+REFERENCE_ALPHABET = np.frombuffer(
+    (string.ascii_uppercase + string.digits).encode("ascii"), dtype=np.uint8
+)
+REFERENCE_CODE_LENGTH = 8
+
+# Reference prefix per FX_ORDER_TYPES entry, NUL-padded to a fixed width
+REFERENCE_PREFIXES = [b"KCH-" if t == "chain" else b"K-" for t in FX_ORDER_TYPES]
+REFERENCE_PREFIX_WIDTH = max(len(p) for p in REFERENCE_PREFIXES)
+REFERENCE_PREFIX_LUT = (
+    np.array(REFERENCE_PREFIXES, dtype=f"S{REFERENCE_PREFIX_WIDTH}")
+    .view(np.uint8)
+    .reshape(len(REFERENCE_PREFIXES), REFERENCE_PREFIX_WIDTH)
+)
+REFERENCE_PREFIX_LENGTHS = np.array([len(p) for p in REFERENCE_PREFIXES])
+
+
+def cumulative_weights(weights: list) -> np.ndarray:
+    """Turn category weights into a normalized CDF for sample_categories."""
+    cdf = np.cumsum(weights, dtype=np.float64)
+    return cdf / cdf[-1]
+
+
+# CDFs of the weighted categories, built once at import
+FX_ORDER_TYPE_CDF = cumulative_weights(FX_ORDER_TYPE_WEIGHTS)
+STATUS_CDF = cumulative_weights(STATUS_WEIGHTS)
+AMOUNT_SIZE_CDF = cumulative_weights(AMOUNT_SIZE_WEIGHTS)
+
+
+def sample_categories(
+    rng: np.random.Generator, cdf: np.ndarray, n: int
+) -> np.ndarray:
+    """Draw n category indices from a CDF built by cumulative_weights."""
+    return np.searchsorted(cdf, rng.random(n), side="right")
+
+
+def generate_references(
+    rng: np.random.Generator, fx_type_idx: np.ndarray
+) -> pa.StringArray:
+    """Generate realistic order references (KCH-xxx for chains, K-xxx otherwise)."""
+    n = len(fx_type_idx)
+    picks = rng.integers(
+        0, len(REFERENCE_ALPHABET), (n, REFERENCE_CODE_LENGTH), dtype=np.uint8
+    )
 
-    # Calculate base rate
-    buy_rate = EXCHANGE_RATES.get(buy_currency, 1.0)
-    sell_rate = EXCHANGE_RATES.get(sell_currency, 1.0)
-    base_rate = sell_rate / buy_rate
+    # One fixed-width row per reference: padded prefix gathered by order type,
+    # followed by the code
+    buf = np.empty((n, REFERENCE_PREFIX_WIDTH + REFERENCE_CODE_LENGTH), np.uint8)
+    buf[:, :REFERENCE_PREFIX_WIDTH] = REFERENCE_PREFIX_LUT[fx_type_idx]
+    buf[:, REFERENCE_PREFIX_WIDTH:] = REFERENCE_ALPHABET[picks]
+    lengths = REFERENCE_PREFIX_LENGTHS[fx_type_idx] + REFERENCE_CODE_LENGTH
+
+    # Dropping the NUL padding packs the rows into an Arrow string array
+    offsets = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(lengths, out=offsets[1:])
+    data = buf[buf != 0]
+    return pa.StringArray.from_buffers(n, pa.py_buffer(offsets), pa.py_buffer(data))
+
+
+def generate_rates(
+    rng: np.random.Generator,
+    buy_idx: np.ndarray,
+    sell_idx: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Generate realistic exchange rates with some variation."""
+    if out is None:
+        out = np.empty(len(buy_idx), dtype=np.float64)
+
+    # Random variation factor (+/- 2%), drawn straight into the output
+    rng.random(out=out)
+    out *= 0.04
+    out += 0.98
+
+    out *= RATE_MATRIX[buy_idx, sell_idx]
+    np.round(out, 7, out=out)
+    out[buy_idx == sell_idx] = 1.0
+    return out
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def fill_amounts_cents(
+        out: np.ndarray,
+        size_idx: np.ndarray,
+        u: np.ndarray,
+        low: np.ndarray,
+        high: np.ndarray,
+    ) -> None:
+        """Scale uniform draws into each row's size-class range in a single pass."""
+        for i in range(len(out)):
+            lo = low[size_idx[i]]
+            hi = high[size_idx[i]]
+            out[i] = (lo + np.int64(u[i] * (hi - lo + 1))) * 100
+
+else:
+
+    def fill_amounts_cents(
+        out: np.ndarray,
+        size_idx: np.ndarray,
+        u: np.ndarray,
+        low: np.ndarray,
+        high: np.ndarray,
+    ) -> None:
+        """Scale uniform draws into each row's size-class range."""
+        lo = low[size_idx]
+        hi = high[size_idx]
+        np.multiply(lo + (u * (hi - lo + 1)).astype(np.int64), 100, out=out)
+
+
+def generate_amounts_cents(
+    rng: np.random.Generator,
+    n: int,
+    out: Optional[np.ndarray] = None,
+    uniform: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Generate realistic order amounts (in cents)."""
+    if out is None:
+        out = np.empty(n, dtype=np.int64)
+    if uniform is None:
+        uniform = np.empty(n, dtype=np.float64)
 
-    # Add some random variation (+/- 2%)
-    variation = random.uniform(-0.02, 0.02)
-    return round(base_rate * (1 + variation), 7)
+    # Mix of different order sizes
+    size_idx = sample_categories(rng, AMOUNT_SIZE_CDF, n)
+    u = rng.random(out=uniform)
+    fill_amounts_cents(out, size_idx, u, AMOUNT_SIZE_LOW, AMOUNT_SIZE_HIGH)
+    return out
 
 
-def generate_amount_cents() -> int:
-    """Generate realistic order amounts (in cents)."""
-    # Mix of different order sizes
-    size_type = random.choices(
-        ["small", "medium", "large", "very_large"],
-        weights=[0.3, 0.4, 0.2, 0.1]
-    )[0]
-
-    if size_type == "small":
-        return random.randint(100_00, 50_000_00) * 100  # 100 - 50K
-    elif size_type == "medium":
-        return random.randint(50_000_00, 500_000_00) * 100  # 50K - 500K
-    elif size_type == "large":
-        return random.randint(500_000_00, 5_000_000_00) * 100  # 500K - 5M
-    else:
-        return random.randint(5_000_000_00, 100_000_000_00) * 100  # 5M - 100M
-
-
-def generate_dates(status: str) -> tuple:
+def generate_dates(
+    rng: np.random.Generator,
+    status_idx: np.ndarray,
+    days_ago_range: tuple = (0, HISTORY_DAYS),
+) -> tuple:
     """Generate realistic creation, execution, and value dates."""
-    # Creation date: within last 12 months
-    days_ago = random.randint(0, 365)
-    creation_date = datetime.now() - timedelta(days=days_ago)
+    n = len(status_idx)
+    today = np.datetime64(datetime.now().date(), "D")
+
+    # Creation date: within last 12 months (or the requested slice of them)
+    days_ago = rng.integers(*days_ago_range, n)
+    creation_date = today - days_ago.astype("timedelta64[D]")
 
     # Value date: 1-12 months after creation
-    value_date_offset = random.randint(1, 365)
-    value_date = creation_date + timedelta(days=value_date_offset)
+    value_date_offset = rng.integers(1, 366, n)
+    value_date = creation_date + value_date_offset.astype("timedelta64[D]")
 
     # Execution date: between creation and now (if executed)
-    execution_date = None
-    if status in ["closed_to_trading", "completed"]:
-        max_exec_days = min(days_ago, (datetime.now() - creation_date).days)
-        if max_exec_days > 0:
-            exec_offset = random.randint(0, max_exec_days)
-            execution_date = creation_date + timedelta(days=exec_offset)
-
-    return (
-        creation_date.strftime("%Y-%m-%d"),
-        execution_date.strftime("%Y-%m-%d") if execution_date else None,
-        value_date.strftime("%Y-%m-%d")
+    executed = np.isin(status_idx, EXECUTED_STATUS_IDX) & (days_ago > 0)
+    exec_offset = rng.integers(0, days_ago + 1)
+    execution_date = np.where(
+        executed,
+        creation_date + exec_offset.astype("timedelta64[D]"),
+        np.datetime64("NaT", "D"),
+    )
+
+    return creation_date, execution_date, value_date
+
+
+def generate_currency_pairs(rng: np.random.Generator, n: int) -> tuple:
+    """Generate realistic currency pairs (most involve EUR) as CURRENCIES indices."""
+    eur_idx = CURRENCIES.index(BASE_CURRENCY)
+    others = np.array(
+        [i for i, c in enumerate(CURRENCIES) if c != BASE_CURRENCY], dtype=np.uint8
+    )
+
+    is_eur_pair = rng.random(n) < 0.7  # 70% involve EUR
+    eur_is_buy = rng.random(n) < 0.5
+    other_a = others[rng.integers(0, len(others), n)]
+    other_b = others[rng.integers(0, len(others), n)]
+
+    # Non-EUR pairs need two distinct currencies: resample the (small) clashing subset
+    clash = ~is_eur_pair & (other_a == other_b)
+    while clash.any():
+        other_b[clash] = others[rng.integers(0, len(others), clash.sum())]
+        clash = ~is_eur_pair & (other_a == other_b)
+
+    buy_idx = np.where(is_eur_pair & eur_is_buy, eur_idx, other_a).astype(np.uint8)
+    sell_idx = np.where(
+        is_eur_pair, np.where(eur_is_buy, other_a, eur_idx), other_b
+    ).astype(np.uint8)
+    return buy_idx, sell_idx
+
+
+def categorical(codes: np.ndarray, categories: list) -> pa.DictionaryArray:
+    """Wrap an index array as a dictionary-encoded column over categories."""
+    return pa.DictionaryArray.from_arrays(
+        pa.array(codes.astype(np.int8), type=pa.int8()), pa.array(categories)
     )
 
 
-def generate_currency_pair() -> tuple:
-    """Generate a realistic currency pair (most involve EUR)."""
-    if random.random() < 0.7:  # 70% involve EUR
-        other = random.choice([c for c in CURRENCIES if c != "EUR"])
-        if random.random() < 0.5:
-            return ("EUR", other)
-        else:
-            return (other, "EUR")
-    else:
-        # Non-EUR pair
-        pair = random.sample([c for c in CURRENCIES if c != "EUR"], 2)
-        return tuple(pair)
+def value_counts(column: pa.ChunkedArray) -> dict:
+    """Count occurrences of each value in a column, most common first."""
+    counts = pc.value_counts(column).to_pylist()
+    counts.sort(key=lambda c: c["counts"], reverse=True)
+    return {c["values"]: c["counts"] for c in counts}
+
+
+class BatchBuffers:
+    """Numeric column buffers reused by every batch a process generates."""
+
+    def __init__(self, n: int):
+        self.size = n
+        self.rate = np.empty(n, dtype=np.float64)
+        self.buy_amount_cents = np.empty(n, dtype=np.int64)
+        self.sell_amount_cents = np.empty(n, dtype=np.int64)
+        self.uniform = np.empty(n, dtype=np.float64)  # Scratch draws
 
 
-def generate_order() -> dict:
-    """Generate a single order record."""
-    fx_order_type = random.choices(FX_ORDER_TYPES, weights=FX_ORDER_TYPE_WEIGHTS)[0]
-    reference = generate_reference(fx_order_type)
+_batch_buffers = None
 
-    market_direction = random.choice(MARKET_DIRECTIONS)
-    status = random.choices(STATUSES, weights=STATUS_WEIGHTS)[0]
 
-    buy_currency, sell_currency = generate_currency_pair()
-    rate = generate_rate(buy_currency, sell_currency)
+def batch_buffers(n: int) -> BatchBuffers:
+    """Return this process's BatchBuffers, growing them to hold n rows."""
+    global _batch_buffers
+    if _batch_buffers is None or _batch_buffers.size < n:
+        _batch_buffers = BatchBuffers(max(n, ROW_GROUP_SIZE))
+    return _batch_buffers
+
+
+def generate_columns(
+    rng: np.random.Generator,
+    n: int,
+    days_ago_range: tuple = (0, HISTORY_DAYS),
+    buffers: Optional[BatchBuffers] = None,
+) -> dict:
+    """Generate n order records as a dict of Arrow column arrays."""
+    if buffers is None:
+        buffers = BatchBuffers(n)
+
+    fx_type_idx = sample_categories(rng, FX_ORDER_TYPE_CDF, n)
+    direction_idx = rng.integers(0, len(MARKET_DIRECTIONS), n)
+    status_idx = sample_categories(rng, STATUS_CDF, n)
+    provider_idx = rng.integers(0, len(LIQUIDITY_PROVIDERS), n)
+    buy_idx, sell_idx = generate_currency_pairs(rng, n)
+
+    reference = generate_references(rng, fx_type_idx)
+    rate = generate_rates(rng, buy_idx, sell_idx, out=buffers.rate[:n])
 
     # Generate amounts
-    buy_amount_cents = generate_amount_cents()
-    sell_amount_cents = int(buy_amount_cents * rate)
-
-    # Determine which is the "amount" vs "counter-amount" based on direction
-    if market_direction == "buy":
-        amount_cents = buy_amount_cents
-        counter_amount_cents = sell_amount_cents
-        currency = buy_currency
-        counter_currency = sell_currency
-    else:
-        amount_cents = sell_amount_cents
-        counter_amount_cents = buy_amount_cents
-        currency = sell_currency
-        counter_currency = buy_currency
-
-    creation_date, execution_date, value_date = generate_dates(status)
+    buy_amount_cents = generate_amounts_cents(
+        rng, n, out=buffers.buy_amount_cents[:n], uniform=buffers.uniform[:n]
+    )
+    sell_amount_cents = np.multiply(
+        buy_amount_cents, rate, out=buffers.sell_amount_cents[:n], casting="unsafe"
+    )
+
+    creation_date, execution_date, value_date = (
+        pa.array(dates, type=pa.date32())
+        for dates in generate_dates(rng, status_idx, days_ago_range)
+    )
 
     return {
         "id": reference,
         "reference": reference,
-        "fx_order_type": fx_order_type,
-        "source": "fx_order",
+        "fx_order_type": categorical(fx_type_idx, FX_ORDER_TYPES),
+        "source": categorical(np.zeros(n), ["fx_order"]),
         "creation_date": creation_date,
-        "market_direction": market_direction,
-        "buy_amount_cents": buy_amount_cents,
-        "sell_amount_cents": sell_amount_cents,
-        "buy_currency": buy_currency,
-        "sell_currency": sell_currency,
-        "amount_cents": amount_cents,
-        "counter_amount_cents": counter_amount_cents,
-        "currency": currency,
-        "counter_currency": counter_currency,
+        "market_direction": categorical(direction_idx, MARKET_DIRECTIONS),
+        "buy_amount_cents": pa.array(buy_amount_cents, type=pa.int64()),
+        "sell_amount_cents": pa.array(sell_amount_cents, type=pa.int64()),
+        "buy_currency": categorical(buy_idx, CURRENCIES),
+        "sell_currency": categorical(sell_idx, CURRENCIES),
         "value_date": value_date,
-        "rate": rate,
-        "liquidity_provider": random.choice(LIQUIDITY_PROVIDERS),
+        "rate": pa.array(rate, type=pa.float64()),
+        "liquidity_provider": categorical(provider_idx, LIQUIDITY_PROVIDERS),
         "execution_date": execution_date,
-        "status": status,
+        "status": categorical(status_idx, STATUSES),
     }
 
 
+def build_batch(
+    seed: np.random.SeedSequence, n: int, days_ago_range: tuple = (0, HISTORY_DAYS)
+) -> bytes:
+    """Generate n order records as a serialized Arrow IPC stream."""
+    rng = np.random.default_rng(seed)
+    # The numeric columns are zero-copy views of this process's BatchBuffers;
+    # the take() below and the IPC serialization both copy them out, so the
+    # buffers are free to refill once this function returns
+    table = pa.table(generate_columns(rng, n, days_ago_range, batch_buffers(n)))
+
+    # Sort by SORT_ORDER; Arrow can't sort dictionary columns, so rank the codes
+    creation_days = table["creation_date"].to_numpy()
+    buy_rank = CURRENCY_SORT_RANK[table["buy_currency"].combine_chunks().indices]
+    table = table.take(np.lexsort((buy_rank, creation_days)))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def read_batch(data: bytes) -> pa.Table:
+    """Deserialize a batch produced by build_batch."""
+    return pa.ipc.open_stream(data).read_all()
+
+
+def generate_batches(num_rows: int):
+    """Generate row-group sized batches in worker processes, yielded in order."""
+    starts = range(0, num_rows, ROW_GROUP_SIZE)
+    # Independent PCG64 streams per batch so workers never share state
+    seeds = np.random.SeedSequence(SEED).spawn(len(starts))
+    workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for seed, start in zip(seeds, starts):
+            size = min(ROW_GROUP_SIZE, num_rows - start)
+            # Oldest batch first, each drawing from its share of the history in
+            # proportion to its rows (at least one day, never past HISTORY_DAYS)
+            newest = HISTORY_DAYS * (num_rows - start - size) // num_rows
+            oldest = HISTORY_DAYS * (num_rows - start) // num_rows
+            days_ago_range = (newest, min(max(oldest, newest + 1), HISTORY_DAYS))
+            pending.append(pool.submit(build_batch, seed, size, days_ago_range))
+            # Keep a bounded window in flight so generation overlaps writing
+            if len(pending) >= 2 * workers:
+                yield read_batch(pending.popleft().result())
+        while pending:
+            yield read_batch(pending.popleft().result())
+
+
 def main():
     print(f"Generating {NUM_ROWS:,} sample orders...")
 
-    # Generate all orders
-    orders = [generate_order() for _ in range(NUM_ROWS)]
+    # Fix the schema from a zero-row batch so every row group matches it
+    schema = read_batch(build_batch(np.random.SeedSequence(SEED), 0)).schema
 
-    # Create DataFrame
-    df = pd.DataFrame(orders)
+    # Dictionary + RLE already packs the tiny-alphabet columns; skip the codec there
+    compression = {
+        field.name: "none" if pa.types.is_dictionary(field.type) else COMPRESSION
+        for field in schema
+    }
+    compression_level = {
+        name: COMPRESSION_LEVEL
+        for name, codec in compression.items()
+        if codec == COMPRESSION
+    }
 
-    # Convert date columns to proper date type
-    df["creation_date"] = pd.to_datetime(df["creation_date"]).dt.date
-    df["value_date"] = pd.to_datetime(df["value_date"]).dt.date
-    df["execution_date"] = pd.to_datetime(df["execution_date"]).dt.date
+    # Generate and write one row group at a time to bound memory use
+    sample = None
+    arrow_options = pa.ipc.IpcWriteOptions(compression=ARROW_COMPRESSION)
+    with pa.OSFile(ARROW_OUTPUT_FILE, "wb") as sink, pa.ipc.new_file(
+        sink, schema, options=arrow_options
+    ) as arrow_writer, pq.ParquetWriter(
+        OUTPUT_FILE,
+        schema,
+        compression=compression,
+        compression_level=compression_level,
+        use_dictionary=[f.name for f in schema if f.name not in COLUMN_ENCODING],
+        column_encoding=COLUMN_ENCODING,
+        data_page_version="2.0",
+        write_statistics=True,
+        sorting_columns=pq.SortingColumn.from_ordering(schema, SORT_ORDER),
+    ) as writer:
+        for batch in generate_batches(NUM_ROWS):
+            writer.write_table(batch)
+            arrow_writer.write_table(batch)
+            if sample is None:
+                sample = batch.slice(0, 5)
 
     # Display sample and stats
     print("\n--- Sample Data (first 5 rows) ---")
-    print(df.head().to_string())
+    for row in sample.to_pylist():
+        print(row)
 
+    table = pq.read_table(
+        OUTPUT_FILE,
+        columns=["fx_order_type", "status", "buy_currency", "creation_date"],
+    )
     print("\n--- Data Statistics ---")
-    print(f"Total rows: {len(df):,}")
-    print(f"Order types: {df['fx_order_type'].value_counts().to_dict()}")
-    print(f"Statuses: {df['status'].value_counts().to_dict()}")
-    print(f"Currencies (buy): {df['buy_currency'].value_counts().to_dict()}")
-    print(f"Date range: {df['creation_date'].min()} to {df['creation_date'].max()}")
-
-    # Save to Parquet
-    df.to_parquet(OUTPUT_FILE, engine="pyarrow", compression="snappy")
+    print(f"Total rows: {table.num_rows:,}")
+    print(f"Order types: {value_counts(table['fx_order_type'])}")
+    print(f"Statuses: {value_counts(table['status'])}")
+    print(f"Currencies (buy): {value_counts(table['buy_currency'])}")
+    date_range = pc.min_max(table["creation_date"])
+    print(f"Date range: {date_range['min']} to {date_range['max']}")
 
     # Report file size
-    import os
     file_size = os.path.getsize(OUTPUT_FILE)
     print("\n--- Output ---")
     print(f"File: {OUTPUT_FILE}")
     print(f"Size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
-    print("Compression: snappy")
+    print(f"Row groups of up to {ROW_GROUP_SIZE:,} rows")
+    print(f"Compression: {COMPRESSION} (level {COMPRESSION_LEVEL})")
+
+    arrow_size = os.path.getsize(ARROW_OUTPUT_FILE)
+    print(f"\nFile: {ARROW_OUTPUT_FILE}")
+    print(f"Size: {arrow_size:,} bytes ({arrow_size / 1024 / 1024:.2f} MB)")
+    print(f"Compression: {ARROW_COMPRESSION}")
 
 
 if __name__ == "__main__":
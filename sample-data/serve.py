@@ -1,31 +1,146 @@
 #!/usr/bin/env python3
 """
 Simple HTTP server with CORS support for serving parquet files.
+Supports single byte-range requests so parquet readers can fetch just the
+footer and the row groups they need.
 Usage: python3 serve.py [port]
 Default port: 8080
 """
 
+import io
+import os
+import re
 import sys
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_byte_range(header, size):
+    """
+    Parse a single 'bytes=start-end' Range header against a file size.
+    Returns (start, end) inclusive, or None if the header should be ignored.
+    Raises ValueError if the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1
+
+    if start >= size or end < start:
+        raise ValueError(f'Range {header!r} not satisfiable for size {size}')
+    return start, end
 
 
 class CORSRequestHandler(SimpleHTTPRequestHandler):
-    """HTTP request handler with CORS headers."""
+    """HTTP request handler with CORS headers and byte-range support."""
+
+    # Length of the byte range being served, None for full responses
+    range_length = None
+    # Whether the current response serves a regular file (and so honours ranges)
+    serving_file = False
 
     def end_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Methods', 'GET, HEAD, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', '*')
+        self.send_header(
+            'Access-Control-Expose-Headers',
+            'Accept-Ranges, Content-Length, Content-Range',
+        )
+        if self.serving_file:
+            self.send_header('Accept-Ranges', 'bytes')
+            self.serving_file = False
         super().end_headers()
 
     def do_OPTIONS(self):
         self.send_response(200)
         self.end_headers()
 
+    def send_head(self):
+        """Serve 206 Partial Content for Range requests on regular files."""
+        self.range_length = None
+        path = self.translate_path(self.path)
+        self.serving_file = os.path.isfile(path)
+        if 'Range' not in self.headers or not self.serving_file:
+            return super().send_head()
+
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return None
+
+        try:
+            fs = os.fstat(f.fileno())
+            try:
+                byte_range = parse_byte_range(self.headers['Range'], fs.st_size)
+            except ValueError:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header('Content-Range', f'bytes */{fs.st_size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                f.close()
+                return None
+            if byte_range is None:
+                f.close()
+                return super().send_head()
+
+            start, end = byte_range
+            f.seek(start)
+            self.range_length = end - start + 1
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-type', self.guess_type(path))
+            self.send_header('Content-Range', f'bytes {start}-{end}/{fs.st_size}')
+            self.send_header('Content-Length', str(self.range_length))
+            self.send_header('Last-Modified', self.date_time_string(fs.st_mtime))
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        """Send files with os.sendfile, falling back to buffered copies."""
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            in_fd = out_fd = None
+        if not hasattr(os, 'sendfile') or in_fd is None or out_fd is None:
+            if self.range_length is None:
+                super().copyfile(source, outputfile)
+            else:
+                outputfile.write(source.read(self.range_length))
+            return
+
+        outputfile.flush()
+        offset = source.tell()
+        remaining = os.fstat(in_fd).st_size - offset
+        if self.range_length is not None:
+            remaining = min(remaining, self.range_length)
+        while remaining > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
 
 def run(port=8080):
     server_address = ('', port)
-    httpd = HTTPServer(server_address, CORSRequestHandler)
+    httpd = ThreadingHTTPServer(server_address, CORSRequestHandler)
     print(f'CORS-enabled server running at http://localhost:{port}')
     print(f'Serving files from current directory')
     print(f'Press Ctrl+C to stop')